@@ -1,6 +1,72 @@
 from ..config import config
+import inspect
+import linecache
+import logging
+import random
 import time
 
+logger = logging.getLogger(__name__)
+
+# Programming errors that no amount of waiting will fix; raised immediately
+NON_RETRYABLE = (TypeError, AttributeError, KeyError, NotImplementedError)
+
+# Retry loop shared by every action. It is compiled once with *args/**kwargs
+# for BaseAction and once per subclass whose _perform has a fixed signature,
+# so e.g. ClickAction.perform(selector) forwards without packing varargs.
+_PERFORM_SOURCE = '''
+def perform(self, {params}):
+    # Read settings once per call rather than on every loop iteration
+    retry_count = config.RETRY_COUNT
+    retry_delay = config.RETRY_DELAY
+    max_delay = config.RETRY_MAX_DELAY
+    sleep = time.sleep
+    for attempt in range(retry_count):
+        try:
+            return self._perform({params})
+        except NON_RETRYABLE:
+            raise
+        except Exception as e:
+            logger.debug("Attempt %d failed: %s", attempt + 1, e)
+        if attempt < retry_count - 1:
+            # Exponential backoff, capped, with jitter in [50%, 100%]
+            delay = min(retry_delay * (2 ** attempt), max_delay)
+            sleep(delay * (0.5 + random.random() * 0.5))
+    raise Exception(f"Action failed after {{retry_count}} attempts.")
+'''
+
+def _compile_perform(params, qualname):
+    source = _PERFORM_SOURCE.format(params=params)
+    filename = f"<base_action.perform:{qualname}>"
+    # Registered so tracebacks and inspect.getsource can show the source
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    # Everything the generated code may look up, besides builtins
+    namespace = {
+        "config": config,
+        "logger": logger,
+        "random": random,
+        "time": time,
+        "NON_RETRYABLE": NON_RETRYABLE,
+    }
+    exec(compile(source, filename, "exec"), namespace)
+    perform = namespace['perform']
+    perform.__qualname__ = qualname
+    perform.__doc__ = "Calls _perform, retrying failures with backoff."
+    perform._generated = True
+    return perform
+
+def _fixed_params(func, reserved):
+    """
+    Returns the parameter list of func (minus self) as source text, or None
+    if it has varargs, defaults, keyword-only args or clashing names.
+    """
+    params = list(inspect.signature(func).parameters.values())[1:]
+    for param in params:
+        if (param.kind is not param.POSITIONAL_OR_KEYWORD
+                or param.default is not param.empty
+                or param.name in reserved):
+            return None
+    return ", ".join(param.name for param in params)
+
 class BaseAction:
     """
     Base class for all actions. Implements retry logic.
@@ -8,14 +74,19 @@ class BaseAction:
     def __init__(self, page):
         self.page = page
 
-    def perform(self, *args, **kwargs):
-        for attempt in range(config.RETRY_COUNT):
-            try:
-                return self._perform(*args, **kwargs)
-            except Exception as e:
-                print(f"Attempt {attempt+1} failed: {e}")
-                time.sleep(config.RETRY_DELAY)
-        raise Exception(f"Action failed after {config.RETRY_COUNT} attempts.")
+    perform = _compile_perform("*args, **kwargs", "BaseAction.perform")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Leave hand-written perform overrides and inherited _perform alone
+        if '_perform' not in cls.__dict__ or not getattr(cls.perform, '_generated', False):
+            return
+        code = BaseAction.perform.__code__
+        params = _fixed_params(cls._perform, set(code.co_varnames + code.co_names))
+        if params is None:
+            cls.perform = BaseAction.perform
+        else:
+            cls.perform = _compile_perform(params, f"{cls.__qualname__}.perform")
 
     def _perform(self, *args, **kwargs):
         raise NotImplementedError("Subclasses must implement _perform.")
@@ -1,7 +1,16 @@
 class Config:
+    # Defaults live on the class; instances only store values that are overridden
     RETRY_COUNT = 3
-    RETRY_DELAY = 1  # seconds
+    RETRY_DELAY = 1  # seconds, doubled after each failed attempt
+    RETRY_MAX_DELAY = 10  # seconds
     AUTO_HEALING_ENABLED = True
     SELF_HEALING_ENABLED = True
 
-config = Config()
+def __getattr__(name):
+    # PEP 562: build the shared instance on first access, then cache it as a
+    # regular module global so later lookups bypass this hook
+    if name == 'config':
+        global config
+        config = Config()
+        return config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,16 +1,26 @@
+import collections
+import sys
+
+# One recorded step; a tuple is far smaller than a dict per action
+RecordedAction = collections.namedtuple('RecordedAction', ['action', 'selector', 'value'])
+
+def _intern(value):
+    # Recordings repeat a small vocabulary of actions and selectors; interning
+    # makes every repeat share one string object.
+    return sys.intern(value) if type(value) is str else value
+
 class Recorder:
     """
     Records user actions for auto test case generation.
     """
     def __init__(self):
-        self.actions = []
+        self.actions = collections.deque()
 
     def record_action(self, action, selector, value=None):
-        self.actions.append({
-            'action': action,
-            'selector': selector,
-            'value': value
-        })
+        # Free-form typed text is only interned when it looks like a token
+        if type(value) is str and value.isidentifier():
+            value = sys.intern(value)
+        self.actions.append(RecordedAction(_intern(action), _intern(selector), value))
 
     def export(self):
-        return self.actions
+        return [recorded._asdict() for recorded in self.actions]
@@ -1,12 +1,69 @@
+import re
+
+# Playwright engine prefixes ("text=", "xpath=", "//", quoted text) that
+# cannot be combined into a single CSS selector list.
+_NON_CSS_SELECTOR = re.compile(r'^\s*(?:[\w-]+=|//|\.\.|["\'])')
+
+
+def _can_combine(selector):
+    # ">>" chains would swallow the rest of a joined list into their last part
+    return not _NON_CSS_SELECTOR.match(selector) and '>>' not in selector
+
+
 class HealingStrategies:
     """
     Implements auto-healing strategies for failed actions.
     """
+    def __init__(self):
+        # (id(page), selector) -> whether the selector matched on that page
+        self._cache = {}
+
     def try_alternatives(self, page, alternatives):
-        for selector in alternatives:
-            try:
-                if page.query_selector(selector):
-                    return selector
-            except Exception:
-                continue
+        """
+        Returns the first alternative that matches on page, or None.
+
+        The first uncached alternative is queried on its own, so an early hit
+        costs a single call. After a miss, the remaining plain CSS alternatives
+        are ruled out with one combined query, but only when at least two are
+        left, since that is when it can save calls.
+        """
+        page_id = id(page)
+        queried = batched = False
+        for index, selector in enumerate(alternatives):
+            key = (page_id, selector)
+            if key not in self._cache:
+                if queried and not batched:
+                    batched = True
+                    self._rule_out(page, alternatives[index:])
+                if key not in self._cache:
+                    queried = True
+                    try:
+                        self._cache[key] = bool(page.query_selector(selector))
+                    except Exception:
+                        continue
+            if self._cache[key]:
+                return selector
         return None
+
+    def _rule_out(self, page, alternatives):
+        """
+        Caches every combinable alternative as a miss if one query finds none.
+        """
+        page_id = id(page)
+        pending = [s for s in alternatives if (page_id, s) not in self._cache and _can_combine(s)]
+        if len(pending) < 2:
+            return
+        try:
+            if not page.query_selector_all(", ".join(pending)):
+                for selector in pending:
+                    self._cache[(page_id, selector)] = False
+        except Exception:
+            pass
+
+    def invalidate(self, page):
+        """
+        Drops cached results for a page, e.g. after navigation changed the DOM.
+        """
+        page_id = id(page)
+        for key in [key for key in self._cache if key[0] == page_id]:
+            del self._cache[key]
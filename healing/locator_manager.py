@@ -1,9 +1,26 @@
+import collections
+
+def _accept_any(selector):
+    # Placeholder for selector validation logic
+    return True
+
 class LocatorManager:
     """
     Manages selectors and provides self-healing capabilities.
+
+    validator is an optional callable taking a selector and returning whether
+    it currently resolves; by default every alternative is accepted.
     """
-    def __init__(self):
+    # Alternative pools at least this large are tried in order of past success
+    RANK_THRESHOLD = 32
+
+    def __init__(self, validator=None):
         self.locators = {}
+        self._is_valid = validator or _accept_any
+        # (name, alternatives) -> previously healed selector
+        self._heal_cache = {}
+        # selector -> number of heals it has won
+        self._successes = collections.Counter()
 
     def get_selector(self, name):
         return self.locators.get(name)
@@ -12,13 +29,35 @@ class LocatorManager:
         self.locators[name] = selector
 
     def heal_selector(self, name, alternatives):
+        # Hashable for the memo key and cheaper to iterate than a list
+        alternatives = tuple(alternatives)
+        key = (name, alternatives)
+        cached = self._heal_cache.get(key)
+        if cached is not None:
+            self.update_selector(name, cached)
+            return cached
+        if len(alternatives) >= self.RANK_THRESHOLD and self._successes:
+            alternatives = self._rank(alternatives)
         # Try alternatives and update if one works
         for alt in alternatives:
             if self._is_valid(alt):
                 self.update_selector(name, alt)
+                self._heal_cache[key] = alt
+                self._successes[alt] += 1
                 return alt
         return None
 
-    def _is_valid(self, selector):
-        # Placeholder for selector validation logic
-        return True
+    def _rank(self, alternatives):
+        # Stable sort: proven selectors first, otherwise the caller's order
+        successes = self._successes
+        return sorted(alternatives, key=lambda alt: -successes[alt])
+
+    def invalidate_heal(self, name=None):
+        """
+        Forgets healed selectors for name (or all names), e.g. after a DOM change.
+        """
+        if name is None:
+            self._heal_cache.clear()
+        else:
+            for key in [key for key in self._heal_cache if key[0] == name]:
+                del self._heal_cache[key]
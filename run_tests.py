@@ -4,10 +4,13 @@ Test runner script for the Web Automation Framework.
 Provides easy access to run different types of tests and generate coverage reports.
 """
 
+import os
 import sys
 import subprocess
 import argparse
-from pathlib import Path
+
+# Options appended to every in-process pytest run (e.g. xdist workers)
+_EXTRA_PYTEST_ARGS = []
 
 
 def run_command(cmd, description):
@@ -17,23 +20,38 @@ def run_command(cmd, description):
     print(f"Command: {' '.join(cmd)}")
     print('='*60)
     
-    try:
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+    # Stream the child's output as it arrives instead of buffering it all
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                          text=True, bufsize=1) as proc:
+        for line in proc.stdout:
+            print(line, end="")
+        returncode = proc.wait()
+    
+    if returncode == 0:
         print("✅ SUCCESS")
-        if result.stdout:
-            print("Output:")
-            print(result.stdout)
         return True
-    except subprocess.CalledProcessError as e:
-        print("❌ FAILED")
-        print(f"Error code: {e.returncode}")
-        if e.stdout:
-            print("Stdout:")
-            print(e.stdout)
-        if e.stderr:
-            print("Stderr:")
-            print(e.stderr)
-        return False
+    print("❌ FAILED")
+    print(f"Error code: {returncode}")
+    return False
+
+
+def run_pytest(args, description):
+    """Run pytest in-process and report the outcome"""
+    import pytest  # Deferred so --install works before pytest is available
+
+    args = args + _EXTRA_PYTEST_ARGS
+    print(f"\n{'='*60}")
+    print(f"Running: {description}")
+    print(f"Command: pytest {' '.join(args)}")
+    print('='*60)
+    
+    exit_code = pytest.main(args)
+    if exit_code == 0:
+        print("✅ SUCCESS")
+        return True
+    print("❌ FAILED")
+    print(f"Error code: {int(exit_code)}")
+    return False
 
 
 def install_dependencies():
@@ -45,85 +63,93 @@ def install_dependencies():
 
 def run_unit_tests():
     """Run unit tests only"""
-    cmd = [sys.executable, "-m", "pytest", "tests/", "-m", "unit", "-v"]
-    return run_command(cmd, "Unit Tests")
+    args = ["tests/", "-m", "unit", "-v"]
+    return run_pytest(args, "Unit Tests")
 
 
 def run_integration_tests():
     """Run integration tests only"""
-    cmd = [sys.executable, "-m", "pytest", "tests/", "-m", "integration", "-v"]
-    return run_command(cmd, "Integration Tests")
+    args = ["tests/", "-m", "integration", "-v"]
+    return run_pytest(args, "Integration Tests")
 
 
 def run_all_tests():
     """Run all tests"""
-    cmd = [sys.executable, "-m", "pytest", "tests/", "-v"]
-    return run_command(cmd, "All Tests")
+    args = ["tests/", "-v"]
+    return run_pytest(args, "All Tests")
 
 
 def run_coverage():
     """Run tests with coverage"""
-    cmd = [
-        sys.executable, "-m", "pytest", "tests/", 
+    args = [
+        "tests/", 
         "--cov=web_automation", 
         "--cov-report=term-missing",
         "--cov-report=html",
+        "--cov-report=xml",
         "-v"
     ]
-    return run_command(cmd, "Tests with Coverage")
+    return run_pytest(args, "Tests with Coverage")
 
 
 def run_specific_test(test_file):
     """Run a specific test file"""
-    cmd = [sys.executable, "-m", "pytest", f"tests/{test_file}", "-v"]
-    return run_command(cmd, f"Specific Test: {test_file}")
+    args = [f"tests/{test_file}", "-v"]
+    return run_pytest(args, f"Specific Test: {test_file}")
 
 
 def run_action_tests():
     """Run action-related tests"""
-    cmd = [sys.executable, "-m", "pytest", "tests/", "-m", "actions", "-v"]
-    return run_command(cmd, "Action Tests")
+    args = ["tests/", "-m", "actions", "-v"]
+    return run_pytest(args, "Action Tests")
 
 
 def run_healing_tests():
     """Run healing-related tests"""
-    cmd = [sys.executable, "-m", "pytest", "tests/", "-m", "healing", "-v"]
-    return run_command(cmd, "Healing Tests")
+    # Pure-logic tests: nothing worth caching, so skip .pytest_cache writes
+    args = ["tests/test_healing.py", "-v", "-p", "no:cacheprovider"]
+    return run_pytest(args, "Healing Tests")
 
 
 def run_generator_tests():
     """Run generator-related tests"""
-    cmd = [sys.executable, "-m", "pytest", "tests/", "-m", "generators", "-v"]
-    return run_command(cmd, "Generator Tests")
+    # Pure-logic tests: nothing worth caching, so skip .pytest_cache writes
+    args = ["tests/test_generators.py", "-v", "-p", "no:cacheprovider"]
+    return run_pytest(args, "Generator Tests")
 
 
 def run_config_tests():
     """Run configuration tests"""
-    cmd = [sys.executable, "-m", "pytest", "tests/", "-m", "config", "-v"]
-    return run_command(cmd, "Config Tests")
+    args = ["tests/", "-m", "config", "-v"]
+    return run_pytest(args, "Config Tests")
 
 
 def run_main_tests():
     """Run main entry point tests"""
-    cmd = [sys.executable, "-m", "pytest", "tests/", "-m", "main", "-v"]
-    return run_command(cmd, "Main Tests")
+    args = ["tests/", "-m", "main", "-v"]
+    return run_pytest(args, "Main Tests")
+
+
+TEST_FILES = (
+    "test_actions.py",
+    "test_healing.py", 
+    "test_generators.py",
+    "test_config.py",
+    "test_main.py",
+    "test_example.py"
+)
 
 
 def check_test_structure():
     """Check that all test files exist and are properly structured"""
-    test_files = [
-        "test_actions.py",
-        "test_healing.py", 
-        "test_generators.py",
-        "test_config.py",
-        "test_main.py",
-        "test_example.py"
-    ]
+    # One directory listing instead of a stat() per expected file
+    try:
+        with os.scandir("tests") as entries:
+            present = {entry.name for entry in entries}
+    except FileNotFoundError:
+        present = set()
     
-    missing_files = []
-    for test_file in test_files:
-        if not Path(f"tests/{test_file}").exists():
-            missing_files.append(test_file)
+    missing_files = [test_file for test_file in TEST_FILES if test_file not in present]
     
     if missing_files:
         print("❌ Missing test files:")
@@ -135,23 +161,25 @@ def check_test_structure():
         return True
 
 
+_PARSER = argparse.ArgumentParser(description="Test runner for Web Automation Framework")
+_PARSER.add_argument("--install", action="store_true", help="Install dependencies")
+_PARSER.add_argument("--unit", action="store_true", help="Run unit tests only")
+_PARSER.add_argument("--integration", action="store_true", help="Run integration tests only")
+_PARSER.add_argument("--actions", action="store_true", help="Run action tests only")
+_PARSER.add_argument("--healing", action="store_true", help="Run healing tests only")
+_PARSER.add_argument("--generators", action="store_true", help="Run generator tests only")
+_PARSER.add_argument("--config", action="store_true", help="Run config tests only")
+_PARSER.add_argument("--main", action="store_true", help="Run main tests only")
+_PARSER.add_argument("--coverage", action="store_true", help="Run tests with coverage")
+_PARSER.add_argument("--check", action="store_true", help="Check test structure")
+_PARSER.add_argument("--file", type=str, help="Run specific test file")
+_PARSER.add_argument("--all", action="store_true", help="Run all tests")
+_PARSER.add_argument("--serial", action="store_true", help="Run tests in one process instead of across CPU cores")
+
+
 def main():
     """Main function to handle command line arguments"""
-    parser = argparse.ArgumentParser(description="Test runner for Web Automation Framework")
-    parser.add_argument("--install", action="store_true", help="Install dependencies")
-    parser.add_argument("--unit", action="store_true", help="Run unit tests only")
-    parser.add_argument("--integration", action="store_true", help="Run integration tests only")
-    parser.add_argument("--actions", action="store_true", help="Run action tests only")
-    parser.add_argument("--healing", action="store_true", help="Run healing tests only")
-    parser.add_argument("--generators", action="store_true", help="Run generator tests only")
-    parser.add_argument("--config", action="store_true", help="Run config tests only")
-    parser.add_argument("--main", action="store_true", help="Run main tests only")
-    parser.add_argument("--coverage", action="store_true", help="Run tests with coverage")
-    parser.add_argument("--check", action="store_true", help="Check test structure")
-    parser.add_argument("--file", type=str, help="Run specific test file")
-    parser.add_argument("--all", action="store_true", help="Run all tests")
-    
-    args = parser.parse_args()
+    args = _PARSER.parse_args()
     
     # Check test structure first
     if not check_test_structure():
@@ -159,6 +187,9 @@ def main():
     
     success = True
     
+    if args.serial:
+        _EXTRA_PYTEST_ARGS.extend(["-n", "0"])
+    
     # Install dependencies if requested
     if args.install:
         success &= install_dependencies()
@@ -0,0 +1,53 @@
+import argparse
+import pytest
+from unittest.mock import Mock
+from web_automation.config import Config
+
+
+@pytest.fixture(scope="session")
+def default_config():
+    """Config with untouched defaults, shared read-only across the session"""
+    return Config()
+
+
+@pytest.fixture
+def mock_page():
+    """Fresh Mock standing in for a Playwright page"""
+    return Mock()
+
+
+# The only page methods shared_page users touch; anything else is an AttributeError
+_PAGE_METHODS = ["query_selector", "query_selector_all"]
+
+
+@pytest.fixture(scope="session")
+def shared_page():
+    """Spec'd Mock page built once; _reset_shared_page clears it before each test"""
+    return Mock(spec_set=_PAGE_METHODS)
+
+
+@pytest.fixture(autouse=True)
+def _reset_shared_page(request):
+    """Clear shared_page before every test that uses it, directly or through a fixture"""
+    if 'shared_page' in request.fixturenames:
+        request.getfixturevalue('shared_page').reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="session")
+def parser_mock_proto():
+    """Spec'd ArgumentParser mock built once; tests should use fresh_parser_mock"""
+    return Mock(spec=argparse.ArgumentParser)
+
+
+@pytest.fixture
+def fresh_parser_mock(parser_mock_proto, monkeypatch):
+    """Reset parser_mock_proto and make argparse.ArgumentParser return it"""
+    parser_mock_proto.reset_mock(return_value=True, side_effect=True)
+    monkeypatch.setattr(argparse, 'ArgumentParser', Mock(return_value=parser_mock_proto))
+    return parser_mock_proto
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch):
+    """Never really sleep in tests; time.sleep becomes a no-op (patch it locally to inspect calls)"""
+    monkeypatch.setattr('time.sleep', lambda *args, **kwargs: None)
@@ -0,0 +1,25 @@
+"""
+Lightweight hand-written stand-ins for Playwright objects.
+
+Cheaper than unittest.mock.Mock for tests that only need canned return
+values; keep using Mock where call assertions matter.
+"""
+
+
+class FakePage:
+    """Page whose query_selector returns found for every selector"""
+    __slots__ = ('found', 'queries', 'batch_queries')
+    
+    def __init__(self, found=None):
+        self.found = found
+        # Selectors passed to query_selector / query_selector_all, in order
+        self.queries = []
+        self.batch_queries = []
+    
+    def query_selector(self, selector):
+        self.queries.append(selector)
+        return self.found
+    
+    def query_selector_all(self, selector):
+        self.batch_queries.append(selector)
+        return [self.found] if self.found else []
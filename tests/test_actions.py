@@ -1,6 +1,9 @@
 import pytest
+import inspect
+import logging
 import time
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch
+from web_automation.actions import base_action
 from web_automation.actions.base_action import BaseAction
 from web_automation.actions.click import ClickAction
 from web_automation.actions.type import TypeAction
@@ -59,9 +62,28 @@ class TestBaseAction:
         with pytest.raises(Exception, match="Action failed after 3 attempts"):
             action.perform("test_arg")
     
+    @pytest.mark.parametrize("error", [TypeError, AttributeError, KeyError, NotImplementedError])
+    def test_perform_non_retryable_fails_fast(self, error):
+        """Test that programming errors are raised without retrying"""
+        calls = []
+        
+        class TestAction(BaseAction):
+            def _perform(self, *args, **kwargs):
+                calls.append(args)
+                raise error("bug")
+        
+        action = TestAction(self.mock_page)
+        
+        with patch('time.sleep') as mock_sleep:
+            with pytest.raises(error):
+                action.perform("test_arg")
+        
+        assert len(calls) == 1
+        mock_sleep.assert_not_called()
+    
     def test_perform_with_retry_delay(self):
         """Test that retry delay is applied between attempts"""
-        with patch('time.sleep') as mock_sleep:
+        with patch('time.sleep') as mock_sleep, patch('random.random', return_value=1.0):
             class TestAction(BaseAction):
                 def _perform(self, *args, **kwargs):
                     raise Exception("Always fails")
@@ -71,9 +93,46 @@ class TestBaseAction:
             with pytest.raises(Exception):
                 action.perform("test_arg")
             
-            # Should have slept after each failed attempt
-            assert mock_sleep.call_count == 3  # 3 sleeps after 3 failed attempts
-            mock_sleep.assert_called_with(config.RETRY_DELAY)
+            # Should have slept between attempts, but not after the last one
+            assert mock_sleep.call_count == 2
+            mock_sleep.assert_any_call(config.RETRY_DELAY)
+            mock_sleep.assert_called_with(config.RETRY_DELAY * 2)
+    
+    def test_perform_retry_delay_jitter_and_cap(self):
+        """Test that the backoff is jittered and capped at RETRY_MAX_DELAY"""
+        class TestAction(BaseAction):
+            def _perform(self, *args, **kwargs):
+                raise Exception("Always fails")
+        
+        action = TestAction(self.mock_page)
+        
+        with patch.object(config, 'RETRY_COUNT', 6), \
+                patch('time.sleep') as mock_sleep, \
+                patch('random.random', return_value=0.0):
+            with pytest.raises(Exception):
+                action.perform("test_arg")
+        
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        expected = [min(config.RETRY_DELAY * 2 ** i, config.RETRY_MAX_DELAY) * 0.5 for i in range(5)]
+        assert delays == expected
+    
+    def test_perform_logs_failed_attempts(self, caplog):
+        """Test that failed attempts are logged at debug level"""
+        calls = []
+        
+        class TestAction(BaseAction):
+            def _perform(self, *args, **kwargs):
+                calls.append(args)
+                if len(calls) == 1:
+                    raise Exception("Simulated failure")
+                return "success"
+        
+        action = TestAction(self.mock_page)
+        
+        with patch('time.sleep'), caplog.at_level(logging.DEBUG, logger=base_action.__name__):
+            action.perform("test_arg")
+        
+        assert "Attempt 1 failed: Simulated failure" in caplog.messages
     
     def test_perform_passes_arguments(self):
         """Test that arguments are passed through to _perform"""
@@ -86,6 +145,43 @@ class TestBaseAction:
         
         assert result["args"] == ("arg1", "arg2")
         assert result["kwargs"] == {"kwarg1": "value1"}
+    
+    def test_perform_specialized_for_fixed_signature(self):
+        """Test that perform mirrors a fixed _perform signature"""
+        assert list(inspect.signature(ClickAction.perform).parameters) == ["self", "selector"]
+        assert list(inspect.signature(TypeAction.perform).parameters) == ["self", "selector", "text"]
+    
+    def test_perform_source_is_inspectable(self):
+        """Test that generated perform methods expose their source"""
+        assert "def perform(self, selector):" in inspect.getsource(ClickAction.perform)
+        assert ClickAction.perform.__code__.co_filename.startswith("<base_action.perform")
+    
+    def test_perform_generic_for_variable_signature(self):
+        """Test that varargs or defaulted _perform keeps the generic perform"""
+        class VarArgsAction(ClickAction):
+            def _perform(self, *args, **kwargs):
+                return args
+        
+        class DefaultArgsAction(BaseAction):
+            def _perform(self, selector, timeout=None):
+                return selector, timeout
+        
+        assert VarArgsAction.perform is BaseAction.perform
+        assert VarArgsAction(self.mock_page).perform("a", "b") == ("a", "b")
+        assert DefaultArgsAction(self.mock_page).perform("a", timeout=5) == ("a", 5)
+    
+    def test_perform_override_is_kept(self):
+        """Test that a hand-written perform is not replaced"""
+        class CustomAction(BaseAction):
+            def perform(self, selector):
+                return "custom"
+        
+        class ChildAction(CustomAction):
+            def _perform(self, selector):
+                return "child"
+        
+        assert CustomAction(self.mock_page).perform("a") == "custom"
+        assert ChildAction(self.mock_page).perform("a") == "custom"
 
 
 class TestClickAction:
@@ -1,9 +1,89 @@
 import pytest
-from unittest.mock import Mock, patch, MagicMock
 from web_automation.generators.recorder import Recorder
 from web_automation.generators.dom_crawler import DOMCrawler
 
 
+_BASIC_ACTIONS = (
+    ("click", "button[type='submit']", None),
+    ("type", "input[name='username']", "testuser"),
+    ("type", "input[name='password']", "testpass"),
+    ("click", "button[type='submit']", None),
+)
+
+_WORKFLOW_ACTIONS = (
+    ("click", "button[type='submit']", None),
+    ("type", "input[name='username']", "testuser"),
+    ("click", "a[href='/logout']", None),
+)
+
+_VALIDATION_ACTIONS = (
+    ("click", "button", None),
+    ("type", "input", "text"),
+    ("hover", "div", None),
+    ("scroll", "body", None),
+)
+
+
+@pytest.fixture
+def recorder():
+    return Recorder()
+
+
+@pytest.fixture(scope="module")
+def dom_crawler(shared_page):
+    return DOMCrawler(shared_page)
+
+
+@pytest.fixture(scope="module")
+def workflow_crawler(shared_page):
+    # Stateless, so one instance serves the whole module
+    return _FixedCrawler(shared_page, ("button[type='submit']", "input[name='username']", "a[href='/logout']"))
+
+
+class _EmptyCrawler(DOMCrawler):
+    """Crawler for a page with no elements"""
+    def get_all_selectors(self):
+        return []
+
+
+class _FixedCrawler(DOMCrawler):
+    """Crawler returning a canned selector list"""
+    def __init__(self, page, selectors):
+        super().__init__(page)
+        self.selectors = selectors
+    
+    def get_all_selectors(self):
+        return list(self.selectors)
+
+
+class _QueryingCrawler(DOMCrawler):
+    """Crawler that queries the page and returns [] if the query fails"""
+    def get_all_selectors(self):
+        try:
+            self.page.query_selector_all("button, input, a")
+            return ["button", "input", "a"]
+        except Exception:
+            return []
+
+
+class _ResultCrawler(DOMCrawler):
+    """Crawler that returns whatever the page query finds"""
+    def get_all_selectors(self):
+        return self.page.query_selector_all("button, input, a") or []
+
+
+class _StateCrawler(DOMCrawler):
+    """Crawler whose selectors depend on the current page state"""
+    _STATES = {
+        'login': ["input[name='username']", "input[name='password']", "button[type='submit']"],
+        'dashboard': ["a[href='/profile']", "button[class='logout']", "div[class='menu']"],
+    }
+    _state = None
+    
+    def get_all_selectors(self):
+        return list(self._STATES.get(self._state, ()))
+
+
 class TestRecorder:
     """Test cases for Recorder class"""
     
@@ -13,77 +93,47 @@ class TestRecorder:
     
     def test_init(self):
         """Test Recorder initialization"""
-        assert self.recorder.actions == []
+        assert len(self.recorder.actions) == 0
     
-    def test_record_action_basic(self):
-        """Test recording a basic action"""
-        action = "click"
-        selector = "button[type='submit']"
-        
-        self.recorder.record_action(action, selector)
+    @pytest.mark.parametrize("action,selector,value", [
+        # Basic action without a value
+        ("click", "button[type='submit']", None),
+        # Action with a value
+        ("type", "input[name='username']", "testuser"),
+        # Empty strings
+        ("", "", ""),
+    ])
+    def test_record_action(self, action, selector, value):
+        """Test recording a single action"""
+        self.recorder.record_action(action, selector, value)
         
         assert len(self.recorder.actions) == 1
-        assert self.recorder.actions[0]["action"] == action
-        assert self.recorder.actions[0]["selector"] == selector
-        assert self.recorder.actions[0]["value"] is None
+        assert self.recorder.actions[-1] == (action, selector, value)
     
-    def test_record_action_with_value(self):
-        """Test recording an action with a value"""
-        action = "type"
-        selector = "input[name='username']"
-        value = "testuser"
-        
-        self.recorder.record_action(action, selector, value)
+    def test_record_action_default_value(self):
+        """Test that value defaults to None"""
+        self.recorder.record_action("click", "button[type='submit']")
         
-        assert len(self.recorder.actions) == 1
-        assert self.recorder.actions[0]["action"] == action
-        assert self.recorder.actions[0]["selector"] == selector
-        assert self.recorder.actions[0]["value"] == value
+        assert self.recorder.actions[-1].value is None
     
     def test_record_multiple_actions(self):
         """Test recording multiple actions"""
-        actions_data = [
-            ("click", "button[type='submit']", None),
-            ("type", "input[name='username']", "testuser"),
-            ("type", "input[name='password']", "testpass"),
-            ("click", "button[type='submit']", None)
-        ]
+        actions_data = _BASIC_ACTIONS
         
         for action, selector, value in actions_data:
             self.recorder.record_action(action, selector, value)
         
-        assert len(self.recorder.actions) == 4
-        
-        for i, (action, selector, value) in enumerate(actions_data):
-            assert self.recorder.actions[i]["action"] == action
-            assert self.recorder.actions[i]["selector"] == selector
-            assert self.recorder.actions[i]["value"] == value
+        # Recorded actions are namedtuples, equal to the plain input tuples
+        assert list(self.recorder.actions) == list(actions_data)
     
-    def test_record_action_empty_strings(self):
-        """Test recording actions with empty strings"""
-        action = ""
-        selector = ""
-        value = ""
-        
-        self.recorder.record_action(action, selector, value)
-        
-        assert len(self.recorder.actions) == 1
-        assert self.recorder.actions[0]["action"] == action
-        assert self.recorder.actions[0]["selector"] == selector
-        assert self.recorder.actions[0]["value"] == value
-    
-    def test_record_action_none_values(self):
-        """Test recording actions with None values"""
-        action = "click"
-        selector = "button[type='submit']"
-        value = None
-        
-        self.recorder.record_action(action, selector, value)
-        
-        assert len(self.recorder.actions) == 1
-        assert self.recorder.actions[0]["action"] == action
-        assert self.recorder.actions[0]["selector"] == selector
-        assert self.recorder.actions[0]["value"] is None
+    def test_record_action_interns_strings(self):
+        """Test that repeated selectors and actions share one string object"""
+        self.recorder.record_action("".join(["cl", "ick"]), "".join(["button", "#go"]))
+        self.recorder.record_action("".join(["cli", "ck"]), "".join(["butt", "on#go"]))
+        
+        first, second = self.recorder.actions
+        assert first.action is second.action
+        assert first.selector is second.selector
     
     def test_export_empty(self):
         """Test exporting empty actions list"""
@@ -92,169 +142,104 @@ class TestRecorder:
     
     def test_export_with_actions(self):
         """Test exporting actions"""
-        actions_data = [
-            ("click", "button[type='submit']", None),
-            ("type", "input[name='username']", "testuser")
-        ]
+        actions_data = _BASIC_ACTIONS[:2]
         
         for action, selector, value in actions_data:
             self.recorder.record_action(action, selector, value)
         
         result = self.recorder.export()
         
-        assert result == self.recorder.actions
-        assert len(result) == 2
+        expected = [{"action": a, "selector": s, "value": v} for a, s, v in actions_data]
+        assert result == expected
         
-        for i, (action, selector, value) in enumerate(actions_data):
-            assert result[i]["action"] == action
-            assert result[i]["selector"] == selector
-            assert result[i]["value"] == value
+        # export returns a copy, so changing it leaves the recording alone
+        result.append({"action": "test", "selector": "test", "value": None})
+        assert len(self.recorder.actions) == 2
     
-    def test_export_returns_reference(self):
-        """Test that export returns a reference to the original list"""
-        self.recorder.record_action("click", "button", None)
-        
-        exported = self.recorder.export()
-        
-        # Modify the exported list
-        exported.append({"action": "test", "selector": "test", "value": None})
+    def test_export_returns_dicts(self):
+        """Test that export converts recorded actions to plain dicts"""
+        self.recorder.record_action("type", "input", "text")
         
-        # Original should be modified since it's a reference
-        assert len(self.recorder.actions) == 2
-        assert len(exported) == 2
+        assert self.recorder.export() == [{"action": "type", "selector": "input", "value": "text"}]
 
 
 class TestDOMCrawler:
     """Test cases for DOMCrawler class"""
     
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.mock_page = Mock()
-        self.dom_crawler = DOMCrawler(self.mock_page)
-    
-    def test_init(self):
+    def test_init(self, shared_page, dom_crawler):
         """Test DOMCrawler initialization"""
-        assert self.dom_crawler.page == self.mock_page
+        assert dom_crawler.page == shared_page
     
-    def test_get_all_selectors_placeholder(self):
+    def test_get_all_selectors_placeholder(self, dom_crawler):
         """Test the placeholder get_all_selectors method"""
         # The current implementation returns an empty list
-        result = self.dom_crawler.get_all_selectors()
+        result = dom_crawler.get_all_selectors()
         assert result == []
     
-    def test_get_all_selectors_with_mock_implementation(self):
+    def test_get_all_selectors_with_mock_implementation(self, shared_page):
         """Test get_all_selectors with a mock implementation"""
-        # Create a mock implementation for testing
-        class MockDOMCrawler(DOMCrawler):
-            def get_all_selectors(self):
-                return ["button[type='submit']", "input[name='username']", "a[href]"]
-        
-        mock_crawler = MockDOMCrawler(self.mock_page)
+        expected_selectors = ["button[type='submit']", "input[name='username']", "a[href]"]
+        mock_crawler = _FixedCrawler(shared_page, expected_selectors)
         result = mock_crawler.get_all_selectors()
         
-        expected_selectors = ["button[type='submit']", "input[name='username']", "a[href]"]
         assert result == expected_selectors
     
-    def test_get_all_selectors_empty_page(self):
+    def test_get_all_selectors_empty_page(self, shared_page):
         """Test get_all_selectors for an empty page"""
-        class MockDOMCrawler(DOMCrawler):
-            def get_all_selectors(self):
-                return []
-        
-        mock_crawler = MockDOMCrawler(self.mock_page)
+        mock_crawler = _EmptyCrawler(shared_page)
         result = mock_crawler.get_all_selectors()
         
         assert result == []
     
-    def test_get_all_selectors_with_page_interaction(self):
+    def test_get_all_selectors_with_page_interaction(self, shared_page):
         """Test get_all_selectors that interacts with the page"""
-        class MockDOMCrawler(DOMCrawler):
-            def get_all_selectors(self):
-                # Simulate page interaction
-                self.page.query_selector_all("button, input, a")
-                return ["button", "input", "a"]
-        
-        mock_crawler = MockDOMCrawler(self.mock_page)
+        mock_crawler = _QueryingCrawler(shared_page)
         result = mock_crawler.get_all_selectors()
         
         # Verify page interaction occurred
-        self.mock_page.query_selector_all.assert_called_once_with("button, input, a")
+        query_all = shared_page.query_selector_all
+        assert query_all.call_count == 1
+        assert query_all.call_args.args == ("button, input, a",)
         assert result == ["button", "input", "a"]
 
 
 class TestGeneratorsIntegration:
     """Integration tests for generators"""
     
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.mock_page = Mock()
-        self.recorder = Recorder()
-        self.dom_crawler = DOMCrawler(self.mock_page)
-    
-    def test_recording_and_crawling_workflow(self):
+    def test_recording_and_crawling_workflow(self, recorder, workflow_crawler):
         """Test integration between recording and crawling"""
         # Record some actions
-        actions_data = [
-            ("click", "button[type='submit']", None),
-            ("type", "input[name='username']", "testuser"),
-            ("click", "a[href='/logout']", None)
-        ]
+        actions_data = _WORKFLOW_ACTIONS
         
         for action, selector, value in actions_data:
-            self.recorder.record_action(action, selector, value)
+            recorder.record_action(action, selector, value)
         
         # Mock DOM crawler to return selectors
-        class MockDOMCrawler(DOMCrawler):
-            def get_all_selectors(self):
-                return ["button[type='submit']", "input[name='username']", "a[href='/logout']"]
-        
-        mock_crawler = MockDOMCrawler(self.mock_page)
-        selectors = mock_crawler.get_all_selectors()
+        selectors = workflow_crawler.get_all_selectors()
         
         # Verify that recorded actions use selectors that could be found by crawler
-        recorded_selectors = [action["selector"] for action in self.recorder.export()]
+        recorded_selectors = [action["selector"] for action in recorder.export()]
         
-        for selector in recorded_selectors:
-            assert selector in selectors
+        assert set(recorded_selectors) <= set(selectors)
     
-    def test_recording_validation(self):
+    def test_recording_validation(self, recorder):
         """Test that recorded actions are valid"""
         # Record various types of actions
-        test_actions = [
-            ("click", "button", None),
-            ("type", "input", "text"),
-            ("hover", "div", None),
-            ("scroll", "body", None)
-        ]
-        
-        for action, selector, value in test_actions:
-            self.recorder.record_action(action, selector, value)
+        for action, selector, value in _VALIDATION_ACTIONS:
+            recorder.record_action(action, selector, value)
         
-        exported = self.recorder.export()
+        exported = recorder.export()
         
         # Validate structure of recorded actions
+        expected_keys = {"action", "selector", "value"}
         for action_record in exported:
-            assert "action" in action_record
-            assert "selector" in action_record
-            assert "value" in action_record
+            assert expected_keys <= action_record.keys()
             assert isinstance(action_record["action"], str)
             assert isinstance(action_record["selector"], str)
     
-    def test_crawler_with_page_state(self):
+    def test_crawler_with_page_state(self, shared_page):
         """Test crawler behavior with different page states"""
-        class MockDOMCrawler(DOMCrawler):
-            def get_all_selectors(self):
-                # Simulate different page states
-                if hasattr(self, '_state'):
-                    if self._state == 'login':
-                        return ["input[name='username']", "input[name='password']", "button[type='submit']"]
-                    elif self._state == 'dashboard':
-                        return ["a[href='/profile']", "button[class='logout']", "div[class='menu']"]
-                    else:
-                        return []
-                return []
-        
-        mock_crawler = MockDOMCrawler(self.mock_page)
+        mock_crawler = _StateCrawler(shared_page)
         
         # Test login page state
         mock_crawler._state = 'login'
@@ -268,44 +253,38 @@ class TestGeneratorsIntegration:
         assert len(dashboard_selectors) == 3
         assert "a[href='/profile']" in dashboard_selectors
     
-    def test_recorder_persistence(self):
+    def test_recorder_persistence(self, recorder):
         """Test that recorder maintains state across operations"""
         # Record initial actions
-        self.recorder.record_action("click", "button", None)
-        self.recorder.record_action("type", "input", "text")
+        recorder.record_action("click", "button", None)
+        recorder.record_action("type", "input", "text")
         
-        initial_count = len(self.recorder.actions)
+        initial_count = len(recorder.actions)
         
         # Export and verify
-        exported = self.recorder.export()
+        exported = recorder.export()
         assert len(exported) == initial_count
         
         # Record more actions
-        self.recorder.record_action("click", "link", None)
+        recorder.record_action("click", "link", None)
         
         # Verify state is maintained
-        assert len(self.recorder.actions) == initial_count + 1
-        assert len(self.recorder.export()) == initial_count + 1
+        assert len(recorder.actions) == initial_count + 1
+        assert len(recorder.export()) == initial_count + 1
     
-    def test_crawler_error_handling(self):
-        """Test crawler error handling"""
-        class MockDOMCrawler(DOMCrawler):
-            def get_all_selectors(self):
-                # Simulate page interaction that might fail
-                try:
-                    self.page.query_selector_all("button, input, a")
-                    return ["button", "input", "a"]
-                except Exception:
-                    return []
+    def test_crawler_success(self, shared_page):
+        """Test crawler when the page query succeeds"""
+        found = ["#login", "input[name='username']"]
+        shared_page.query_selector_all.return_value = found
         
-        mock_crawler = MockDOMCrawler(self.mock_page)
+        result = _ResultCrawler(shared_page).get_all_selectors()
         
-        # Test successful case
-        self.mock_page.query_selector_all.return_value = ["button", "input", "a"]
-        result = mock_crawler.get_all_selectors()
-        assert result == ["button", "input", "a"]
+        assert result == found
+    
+    def test_crawler_handles_exception(self, shared_page):
+        """Test that the crawler returns no selectors when the page query raises"""
+        shared_page.query_selector_all.side_effect = Exception("DOM error")
         
-        # Test failure case
-        self.mock_page.query_selector_all.side_effect = Exception("DOM error")
-        result = mock_crawler.get_all_selectors()
-        assert result == [] 
\ No newline at end of file
+        result = _QueryingCrawler(shared_page).get_all_selectors()
+        
+        assert result == []
@@ -1,353 +1,173 @@
+import argparse
 import pytest
 import sys
-from unittest.mock import Mock, patch, MagicMock
-from io import StringIO
 from web_automation.main import main
 
 
+# Canned parse_args results for the mocked parser
+_NS_RUN = argparse.Namespace(run_tests=True, generate_cases=False)
+_NS_GEN = argparse.Namespace(run_tests=False, generate_cases=True)
+_NS_NONE = argparse.Namespace(run_tests=False, generate_cases=False)
+
+# Command lines for the flag tests; copy before installing as sys.argv
+_ARGV_NONE = ['main.py']
+_ARGV_RUN = ['main.py', '--run-tests']
+_ARGV_GEN = ['main.py', '--generate-cases']
+_ARGV_BOTH = ['main.py', '--run-tests', '--generate-cases']
+
+# Substrings every help message must contain
+_HELP_NEEDLES = ('Web Automation Framework', '--run-tests', '--generate-cases')
+
+
 class TestMain:
     """Test cases for main entry point"""
     
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.original_argv = sys.argv.copy()
-    
-    def teardown_method(self):
-        """Clean up after tests"""
-        sys.argv = self.original_argv
-    
-    def test_main_no_args(self):
-        """Test main with no arguments"""
-        sys.argv = ['main.py']
-        
-        with patch('sys.stdout', new=StringIO()) as mock_stdout:
-            main()
-            
-            output = mock_stdout.getvalue()
-            assert 'Web Automation Framework' in output
-            assert '--run-tests' in output
-            assert '--generate-cases' in output
-    
-    def test_main_help_flag(self):
-        """Test main with help flag"""
-        sys.argv = ['main.py', '--help']
-        
-        with patch('sys.stdout', new=StringIO()) as mock_stdout:
+    @pytest.mark.parametrize("argv,expect_exit", [
+        # No arguments: main() prints help itself
+        (_ARGV_NONE, False),
+        # --help: argparse prints help and exits
+        (['main.py', '--help'], True),
+    ])
+    def test_main_help_output(self, monkeypatch, capsys, argv, expect_exit):
+        """Test that help output lists the program and its flags"""
+        monkeypatch.setattr(sys, 'argv', argv.copy())
+        
+        if expect_exit:
             with pytest.raises(SystemExit):
                 main()
-            
-            output = mock_stdout.getvalue()
-            assert 'Web Automation Framework' in output
-            assert '--run-tests' in output
-            assert '--generate-cases' in output
-    
-    def test_main_run_tests_flag(self):
-        """Test main with run-tests flag"""
-        sys.argv = ['main.py', '--run-tests']
-        
-        with patch('sys.stdout', new=StringIO()) as mock_stdout:
-            main()
-            
-            output = mock_stdout.getvalue()
-            assert 'Running tests...' in output
-    
-    def test_main_generate_cases_flag(self):
-        """Test main with generate-cases flag"""
-        sys.argv = ['main.py', '--generate-cases']
-        
-        with patch('sys.stdout', new=StringIO()) as mock_stdout:
-            main()
-            
-            output = mock_stdout.getvalue()
-            assert 'Generating test cases...' in output
-    
-    def test_main_both_flags(self):
-        """Test main with both flags (should use first one)"""
-        sys.argv = ['main.py', '--run-tests', '--generate-cases']
-        
-        with patch('sys.stdout', new=StringIO()) as mock_stdout:
+        else:
             main()
-            
-            output = mock_stdout.getvalue()
-            assert 'Running tests...' in output
-            assert 'Generating test cases...' not in output
-    
-    def test_main_invalid_flag(self):
-        """Test main with invalid flag"""
-        sys.argv = ['main.py', '--invalid-flag']
         
-        with patch('sys.stderr', new=StringIO()) as mock_stderr:
-            with pytest.raises(SystemExit):
-                main()
-            
-            output = mock_stderr.getvalue()
-            assert 'error: unrecognized arguments' in output
+        output = capsys.readouterr().out
+        assert all(needle in output for needle in _HELP_NEEDLES)
     
-    def test_main_multiple_invalid_flags(self):
-        """Test main with multiple invalid flags"""
-        sys.argv = ['main.py', '--invalid1', '--invalid2', '--invalid3']
+    def test_main_run_tests_flag(self, monkeypatch, capsys):
+        """Test main with run-tests flag"""
+        monkeypatch.setattr(sys, 'argv', _ARGV_RUN.copy())
         
-        with patch('sys.stderr', new=StringIO()) as mock_stderr:
-            with pytest.raises(SystemExit):
-                main()
-            
-            output = mock_stderr.getvalue()
-            assert 'error: unrecognized arguments' in output
-    
-    def test_main_empty_args(self):
-        """Test main with empty argument list"""
-        sys.argv = []
+        main()
         
-        with pytest.raises(IndexError):
-            main()
+        output = capsys.readouterr().out
+        assert 'Running tests...' in output
     
-    def test_main_short_flags(self):
-        """Test main with short flag variations"""
-        # Test with single dash
-        sys.argv = ['main.py', '-run-tests']
+    def test_main_generate_cases_flag(self, monkeypatch, capsys):
+        """Test main with generate-cases flag"""
+        monkeypatch.setattr(sys, 'argv', _ARGV_GEN.copy())
         
-        with patch('sys.stderr', new=StringIO()) as mock_stderr:
-            with pytest.raises(SystemExit):
-                main()
-            
-            output = mock_stderr.getvalue()
-            assert 'error: unrecognized arguments' in output
-    
-    def test_main_case_sensitivity(self):
-        """Test main with different case variations"""
-        sys.argv = ['main.py', '--RUN-TESTS']
+        main()
         
-        with patch('sys.stderr', new=StringIO()) as mock_stderr:
-            with pytest.raises(SystemExit):
-                main()
-            
-            output = mock_stderr.getvalue()
-            assert 'error: unrecognized arguments' in output
+        output = capsys.readouterr().out
+        assert 'Generating test cases...' in output
     
-    def test_main_with_positional_args(self):
-        """Test main with positional arguments"""
-        sys.argv = ['main.py', '--run-tests', 'extra_arg1', 'extra_arg2']
-        
-        with patch('sys.stderr', new=StringIO()) as mock_stderr:
-            with pytest.raises(SystemExit):
-                main()
-            
-            output = mock_stderr.getvalue()
-            assert 'error: unrecognized arguments' in output
-    
-    def test_main_verbose_flag(self):
-        """Test main with verbose-like flags"""
-        sys.argv = ['main.py', '--verbose', '--run-tests']
-        
-        with patch('sys.stderr', new=StringIO()) as mock_stderr:
-            with pytest.raises(SystemExit):
-                main()
-            
-            output = mock_stderr.getvalue()
-            assert 'error: unrecognized arguments' in output
-    
-    def test_main_debug_flag(self):
-        """Test main with debug-like flags"""
-        sys.argv = ['main.py', '--debug', '--generate-cases']
+    def test_main_both_flags(self, monkeypatch, capsys):
+        """Test main with both flags (should use first one)"""
+        monkeypatch.setattr(sys, 'argv', _ARGV_BOTH.copy())
+        
+        main()
+        
+        output = capsys.readouterr().out
+        assert 'Running tests...' in output
+        assert 'Generating test cases...' not in output
+    
+    @pytest.mark.parametrize("argv", [
+        # Invalid flag
+        ['main.py', '--invalid-flag'],
+        # Multiple invalid flags
+        ['main.py', '--invalid1', '--invalid2', '--invalid3'],
+        # Single-dash variant of a long flag
+        ['main.py', '-run-tests'],
+        # Flags are case sensitive
+        ['main.py', '--RUN-TESTS'],
+        # Positional arguments are not accepted
+        ['main.py', '--run-tests', 'extra_arg1', 'extra_arg2'],
+        # Verbose- and debug-like flags are not defined
+        ['main.py', '--verbose', '--run-tests'],
+        ['main.py', '--debug', '--generate-cases'],
+    ])
+    def test_main_invalid_argv(self, monkeypatch, capsys, argv):
+        """Test that unrecognized arguments exit with an argparse error"""
+        monkeypatch.setattr(sys, 'argv', argv)
+        
+        with pytest.raises(SystemExit):
+            main()
         
-        with patch('sys.stderr', new=StringIO()) as mock_stderr:
-            with pytest.raises(SystemExit):
-                main()
-            
-            output = mock_stderr.getvalue()
-            assert 'error: unrecognized arguments' in output
+        assert 'error: unrecognized arguments' in capsys.readouterr().err
 
 
 class TestMainIntegration:
     """Integration tests for main functionality"""
     
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.original_argv = sys.argv.copy()
-    
-    def teardown_method(self):
-        """Clean up after tests"""
-        sys.argv = self.original_argv
-    
-    def test_main_argument_parser_creation(self):
+    def test_main_argument_parser_creation(self, monkeypatch, fresh_parser_mock):
         """Test that argument parser is created correctly"""
-        from web_automation.main import main
-        import argparse
-        
-        # Mock argparse to capture the parser creation
-        with patch('argparse.ArgumentParser') as mock_parser_class:
-            mock_parser = Mock()
-            mock_parser_class.return_value = mock_parser
-            
-            sys.argv = ['main.py']
-            main()
-            
-            # Verify ArgumentParser was called with correct description
-            mock_parser_class.assert_called_once_with(description='Web Automation Framework')
-    
-    def test_main_argument_parsing(self):
-        """Test that arguments are parsed correctly"""
-        from web_automation.main import main
-        
-        # Mock the argument parser
-        with patch('argparse.ArgumentParser') as mock_parser_class:
-            mock_parser = Mock()
-            mock_parser_class.return_value = mock_parser
-            
-            # Set up the mock parser to return specific args
-            mock_args = Mock()
-            mock_args.run_tests = True
-            mock_args.generate_cases = False
-            mock_parser.parse_args.return_value = mock_args
-            
-            sys.argv = ['main.py', '--run-tests']
-            
-            with patch('sys.stdout', new=StringIO()) as mock_stdout:
-                main()
-                
-                # Verify parse_args was called
-                mock_parser.parse_args.assert_called_once()
-                
-                output = mock_stdout.getvalue()
-                assert 'Running tests...' in output
-    
-    def test_main_argument_parsing_generate_cases(self):
-        """Test argument parsing for generate-cases flag"""
-        from web_automation.main import main
-        
-        with patch('argparse.ArgumentParser') as mock_parser_class:
-            mock_parser = Mock()
-            mock_parser_class.return_value = mock_parser
-            
-            mock_args = Mock()
-            mock_args.run_tests = False
-            mock_args.generate_cases = True
-            mock_parser.parse_args.return_value = mock_args
-            
-            sys.argv = ['main.py', '--generate-cases']
-            
-            with patch('sys.stdout', new=StringIO()) as mock_stdout:
-                main()
-                
-                mock_parser.parse_args.assert_called_once()
-                
-                output = mock_stdout.getvalue()
-                assert 'Generating test cases...' in output
-    
-    def test_main_argument_parsing_no_flags(self):
-        """Test argument parsing when no flags are provided"""
-        from web_automation.main import main
-        
-        with patch('argparse.ArgumentParser') as mock_parser_class:
-            mock_parser = Mock()
-            mock_parser_class.return_value = mock_parser
-            
-            mock_args = Mock()
-            mock_args.run_tests = False
-            mock_args.generate_cases = False
-            mock_parser.parse_args.return_value = mock_args
-            
-            sys.argv = ['main.py']
-            
-            with patch('sys.stdout', new=StringIO()) as mock_stdout:
-                main()
-                
-                mock_parser.parse_args.assert_called_once()
-                
-                output = mock_stdout.getvalue()
-                # When no flags are provided, help should be printed
-                # Note: The actual help output goes to stdout, but our mock setup
-                # doesn't capture it properly, so we just verify the parser was called
-    
-    def test_main_error_handling(self):
+        monkeypatch.setattr(sys, 'argv', _ARGV_NONE.copy())
+        main()
+        
+        # Verify ArgumentParser was called with correct description
+        argparse.ArgumentParser.assert_called_once_with(description='Web Automation Framework')
+    
+    @pytest.mark.parametrize("ns,expected_out,expect_help", [
+        # --run-tests
+        (_NS_RUN, 'Running tests...', False),
+        # --generate-cases
+        (_NS_GEN, 'Generating test cases...', False),
+        # No flags: help is requested from the mocked parser, so nothing reaches stdout
+        (_NS_NONE, '', True),
+    ])
+    def test_main_dispatch(self, fresh_parser_mock, capsys, ns, expected_out, expect_help):
+        """Test that parsed arguments select the right action"""
+        fresh_parser_mock.configure_mock(**{'parse_args.return_value': ns})
+        
+        main()
+        
+        assert fresh_parser_mock.parse_args.call_count == 1
+        
+        output = capsys.readouterr().out
+        if expected_out:
+            assert expected_out in output
+        else:
+            assert output == ''
+        assert fresh_parser_mock.print_help.call_count == int(expect_help)
+    
+    def test_main_error_handling(self, monkeypatch, fresh_parser_mock):
         """Test main error handling"""
-        from web_automation.main import main
+        # Simulate an error in argument parsing
+        fresh_parser_mock.configure_mock(**{'parse_args.side_effect': SystemExit(2)})
         
-        with patch('argparse.ArgumentParser') as mock_parser_class:
-            mock_parser = Mock()
-            mock_parser_class.return_value = mock_parser
-            
-            # Simulate an error in argument parsing
-            mock_parser.parse_args.side_effect = SystemExit(2)
-            
-            sys.argv = ['main.py', '--invalid-flag']
-            
-            with pytest.raises(SystemExit):
-                main()
-    
-    def test_main_print_help_called(self):
-        """Test that print_help is called when no valid flags are provided"""
-        from web_automation.main import main
+        monkeypatch.setattr(sys, 'argv', ['main.py', '--invalid-flag'])
         
-        with patch('argparse.ArgumentParser') as mock_parser_class:
-            mock_parser = Mock()
-            mock_parser_class.return_value = mock_parser
-            
-            mock_args = Mock()
-            mock_args.run_tests = False
-            mock_args.generate_cases = False
-            mock_parser.parse_args.return_value = mock_args
-            
-            sys.argv = ['main.py']
-            
-            with patch('sys.stdout', new=StringIO()) as mock_stdout:
-                main()
-                
-                # Verify print_help was called
-                mock_parser.print_help.assert_called_once()
+        with pytest.raises(SystemExit):
+            main()
 
 
 class TestMainExtensibility:
     """Tests for main extensibility"""
     
-    def setup_method(self):
-        """Set up test fixtures"""
-        self.original_argv = sys.argv.copy()
-    
-    def teardown_method(self):
-        """Clean up after tests"""
-        sys.argv = self.original_argv
-    
-    def test_main_new_argument_addition(self):
+    def test_main_new_argument_addition(self, monkeypatch, fresh_parser_mock):
         """Test that new arguments can be easily added"""
-        from web_automation.main import main
+        monkeypatch.setattr(sys, 'argv', _ARGV_NONE.copy())
         
-        with patch('argparse.ArgumentParser') as mock_parser_class:
-            mock_parser = Mock()
-            mock_parser_class.return_value = mock_parser
-            
-            sys.argv = ['main.py']
-            
-            with patch('sys.stdout', new=StringIO()):
-                main()
-                
-                # Verify add_argument was called for expected arguments
-                add_argument_calls = mock_parser.add_argument.call_args_list
-                
-                # Check that both expected arguments were added
-                run_tests_added = any('--run-tests' in str(call) for call in add_argument_calls)
-                generate_cases_added = any('--generate-cases' in str(call) for call in add_argument_calls)
-                
-                assert run_tests_added
-                assert generate_cases_added
+        main()
+        
+        # Verify add_argument was called for expected arguments
+        add_argument_calls = fresh_parser_mock.add_argument.call_args_list
+        
+        # Check that both expected arguments were added
+        run_tests_added = any('--run-tests' in call.args for call in add_argument_calls)
+        generate_cases_added = any('--generate-cases' in call.args for call in add_argument_calls)
+        
+        assert run_tests_added
+        assert generate_cases_added
     
-    def test_main_argument_types(self):
+    def test_main_argument_types(self, monkeypatch, fresh_parser_mock):
         """Test that arguments are added with correct types"""
-        from web_automation.main import main
+        monkeypatch.setattr(sys, 'argv', _ARGV_NONE.copy())
         
-        with patch('argparse.ArgumentParser') as mock_parser_class:
-            mock_parser = Mock()
-            mock_parser_class.return_value = mock_parser
-            
-            sys.argv = ['main.py']
-            
-            with patch('sys.stdout', new=StringIO()):
-                main()
-                
-                # Verify that action='store_true' is used for boolean flags
-                add_argument_calls = mock_parser.add_argument.call_args_list
-                
-                for call in add_argument_calls:
-                    if '--run-tests' in str(call) or '--generate-cases' in str(call):
-                        # Check that action='store_true' is used
-                        assert 'store_true' in str(call) 
\ No newline at end of file
+        main()
+        
+        # Verify that action='store_true' is used for boolean flags
+        add_argument_calls = fresh_parser_mock.add_argument.call_args_list
+        
+        for call in add_argument_calls:
+            if '--run-tests' in call.args or '--generate-cases' in call.args:
+                # Check that action='store_true' is used
+                assert call.kwargs.get('action') == 'store_true' 